@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import pathlib
-from dataclasses import asdict
+import threading
+import time
+from typing import Any, Optional
 
+import orjson
 from flask import Flask, jsonify, request, send_from_directory
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from werkzeug.exceptions import BadRequest
 
 from backend.api.schemas import EmergencyRequest, EmergencyResponse, HealthPredictionRequest
+from backend.ml.batching import MicroBatcher
 from backend.ml.predictor import HeartAttackPredictor
 from backend.services.emergency import EmergencyDispatcher
+from backend.utils.cache import LRUCache
 from backend.utils.config import get_settings
 
 logging.basicConfig(level=logging.INFO)
@@ -18,35 +26,183 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 frontend_path = pathlib.Path("frontend").resolve()
 
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson's C encoder/decoder."""
+
+    option = orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=self.option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=self.option), mimetype="application/json")
+
+
 app = Flask(__name__, static_folder=str(frontend_path), static_url_path="")
+app.json = OrjsonProvider(app)
 CORS(app, resources={r"/api/*": {"origins": settings.allowed_origins or ["*"]}})
 
-predictor = HeartAttackPredictor()
+_predictor: Optional[HeartAttackPredictor] = None
+_predictor_lock = threading.Lock()
+_predictor_warmup: Optional[threading.Thread] = None
+# consecutive failed warm-ups; each one doubles the wait before health probes retry
+_predictor_failures = 0
+_predictor_retry_at = 0.0
 emergency_dispatcher = EmergencyDispatcher()
+prediction_cache: LRUCache[dict] = LRUCache(maxsize=4096)
+probability_batcher: MicroBatcher[HealthPredictionRequest, float] = MicroBatcher(
+    lambda payloads: get_predictor().predict_proba(payloads).tolist(),
+    max_batch_size=32,
+)
+
+MAX_BATCH_REQUESTS = 1024
+WARMUP_RETRY_MIN = 5.0
+WARMUP_RETRY_MAX = 300.0
+
+# health payloads never change, so encode them once
+_HEALTH_LOADED = orjson.dumps({"status": "ok", "model": "loaded"})
+_HEALTH_LOADING = orjson.dumps({"status": "ok", "model": "loading"})
+_HEALTH_ERROR = orjson.dumps({"status": "error", "model": "error"})
+
+
+def get_predictor() -> HeartAttackPredictor:
+    """Return the process-wide predictor, loading artifacts on first use."""
+    global _predictor
+    if _predictor is None:
+        with _predictor_lock:
+            if _predictor is None:
+                _predictor = HeartAttackPredictor()
+    return _predictor
+
+
+def _warm_predictor() -> None:
+    global _predictor_warmup, _predictor_failures, _predictor_retry_at
+    try:
+        get_predictor()
+    except Exception as exc:
+        with _predictor_lock:
+            _predictor_failures += 1
+            delay = min(WARMUP_RETRY_MIN * 2 ** (_predictor_failures - 1), WARMUP_RETRY_MAX)
+            _predictor_retry_at = time.monotonic() + delay
+            # let a health probe start a fresh attempt once the delay has passed
+            _predictor_warmup = None
+        if _predictor_failures == 1:
+            logger.exception("Predictor warm-up failed; retrying in %.0fs", delay)
+        else:
+            logger.warning("Predictor warm-up failed again (%s); retrying in %.0fs", exc, delay)
+
+
+def _prediction_key(payload: HealthPredictionRequest, detail: bool) -> bytes:
+    # name, notes and emergency contacts do not influence the prediction
+    features = (
+        payload.age,
+        payload.sex.value,
+        payload.chest_pain_type.value,
+        payload.bp_systolic,
+        payload.bp_diastolic,
+        payload.cholesterol,
+        payload.sugar_level,
+        payload.calories_burned,
+        payload.max_heart_rate,
+        payload.resting_ecg.value,
+        payload.exercise_angina,
+        payload.st_depression,
+        payload.slope.value,
+        payload.num_major_vessels,
+        payload.thalassemia.value,
+        payload.fasting_hours,
+        payload.smoker,
+        payload.diabetic,
+        detail,
+    )
+    return hashlib.blake2b(repr(features).encode(), digest_size=16).digest()
+
+
+def _json_body() -> Any:
+    # parse the raw body directly; cache=False avoids keeping a copy on the request
+    try:
+        return orjson.loads(request.get_data(cache=False) or b"{}") or {}
+    except orjson.JSONDecodeError as exc:
+        raise BadRequest(f"Invalid JSON body: {exc}") from exc
+
+
+def _wants_detail() -> bool:
+    # ?detail=0 returns only the risk head (no chart, insights or recommendations)
+    return request.args.get("detail") != "0"
 
 
 @app.route("/api/health", methods=["GET"])
 def health_check():
-    return jsonify({"status": "ok", "model": "loaded" if predictor.weights else "loading"})
+    global _predictor_warmup
+    if _predictor is None and _predictor_warmup is None and time.monotonic() >= _predictor_retry_at:
+        with _predictor_lock:
+            if _predictor is None and _predictor_warmup is None:
+                # load in the background so probes never block on artifact parsing
+                _predictor_warmup = threading.Thread(target=_warm_predictor, name="predictor-warmup", daemon=True)
+                _predictor_warmup.start()
+    if _predictor is not None and _predictor.weights:
+        return app.response_class(_HEALTH_LOADED, mimetype="application/json")
+    if _predictor_failures:
+        # the last warm-up failed; stays an error until a retry succeeds
+        return app.response_class(_HEALTH_ERROR, status=503, mimetype="application/json")
+    return app.response_class(_HEALTH_LOADING, mimetype="application/json")
 
 
 @app.route("/api/predict", methods=["POST"])
 def predict():
-    data = request.get_json(force=True, silent=False) or {}
+    data = _json_body()
     try:
         payload = HealthPredictionRequest.from_dict(data)
-        result = predictor.predict(payload)
-        return jsonify(asdict(result))
+        detail = _wants_detail()
+        key = _prediction_key(payload, detail)
+        cached = prediction_cache.get(key)
+        if cached is None:
+            predictor = get_predictor()
+            probability = probability_batcher.submit(payload)
+            cached = predictor.build_response(payload, probability, detail).to_dict()
+            prediction_cache.put(key, cached)
+        return jsonify({**cached, "name": payload.name})
     except ValueError as exc:
         return jsonify({"error": str(exc)}), 400
     except FileNotFoundError as exc:
         logger.exception("Model artifacts missing")
-        return jsonify({"error": str(exc)}), 500
+        return jsonify({"error": str(exc)}), 503
+
+
+@app.route("/api/predict/batch", methods=["POST"])
+def predict_batch():
+    data = _json_body()
+    items = data.get("requests") if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        return jsonify({"error": "'requests' must be a list"}), 400
+    if len(items) > MAX_BATCH_REQUESTS:
+        return jsonify({"error": f"At most {MAX_BATCH_REQUESTS} requests per batch"}), 400
+
+    payloads = []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            return jsonify({"error": f"requests[{index}]: must be an object"}), 400
+        try:
+            payloads.append(HealthPredictionRequest.from_dict(item))
+        except ValueError as exc:
+            return jsonify({"error": f"requests[{index}]: {exc}"}), 400
+
+    try:
+        results = get_predictor().predict_batch(payloads, detail=_wants_detail())
+    except FileNotFoundError as exc:
+        logger.exception("Model artifacts missing")
+        return jsonify({"error": str(exc)}), 503
+    return jsonify({"results": [result.to_dict() for result in results]})
 
 
 @app.route("/api/emergency/notify", methods=["POST"])
 def emergency_notify():
-    data = request.get_json(force=True, silent=False) or {}
+    data = _json_body()
     try:
         payload = EmergencyRequest.from_dict(data)
     except ValueError as exc:
@@ -70,7 +226,7 @@ def emergency_notify():
         calls_triggered=call_contacts,
         dry_run=not emergency_dispatcher.is_configured,
     )
-    return jsonify(asdict(response))
+    return jsonify(response.to_dict())
 
 
 @app.route("/", defaults={"path": ""})
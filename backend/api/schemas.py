@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Type, TypeVar
 
 
 class SexEnum(str, Enum):
@@ -35,6 +35,23 @@ class ThalEnum(str, Enum):
     reversible_defect = "reversible_defect"
 
 
+E = TypeVar("E", bound=Enum)
+
+# value -> member tables; a dict hit is much cheaper than Enum.__call__
+_SEX_MAP = {member.value: member for member in SexEnum}
+_CHEST_PAIN_MAP = {member.value: member for member in ChestPainEnum}
+_REST_ECG_MAP = {member.value: member for member in RestECGEnum}
+_SLOPE_MAP = {member.value: member for member in SlopeEnum}
+_THAL_MAP = {member.value: member for member in ThalEnum}
+
+
+def _enum(members: Dict[str, E], enum_cls: Type[E], value) -> E:
+    try:
+        return members[value]
+    except (KeyError, TypeError):
+        raise ValueError(f"{value!r} is not a valid {enum_cls.__name__}") from None
+
+
 def _bool(value) -> bool:
     if isinstance(value, bool):
         return value
@@ -51,7 +68,7 @@ def _list(value) -> List[str]:
     return [item.strip() for item in str(value).split(",") if item.strip()]
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthPredictionRequest:
     name: str
     age: int
@@ -102,20 +119,20 @@ class HealthPredictionRequest:
         return cls(
             name=str(data["name"]),
             age=int(data["age"]),
-            sex=SexEnum(data["sex"]),
-            chest_pain_type=ChestPainEnum(data["chest_pain_type"]),
+            sex=_enum(_SEX_MAP, SexEnum, data["sex"]),
+            chest_pain_type=_enum(_CHEST_PAIN_MAP, ChestPainEnum, data["chest_pain_type"]),
             bp_systolic=float(data["bp_systolic"]),
             bp_diastolic=float(data["bp_diastolic"]),
             cholesterol=float(data["cholesterol"]),
             sugar_level=float(data["sugar_level"]),
             calories_burned=float(data["calories_burned"]),
             max_heart_rate=float(data["max_heart_rate"]),
-            resting_ecg=RestECGEnum(data["resting_ecg"]),
+            resting_ecg=_enum(_REST_ECG_MAP, RestECGEnum, data["resting_ecg"]),
             exercise_angina=_bool(data["exercise_angina"]),
             st_depression=float(data["st_depression"]),
-            slope=SlopeEnum(data["slope"]),
+            slope=_enum(_SLOPE_MAP, SlopeEnum, data["slope"]),
             num_major_vessels=int(data["num_major_vessels"]),
-            thalassemia=ThalEnum(data["thalassemia"]),
+            thalassemia=_enum(_THAL_MAP, ThalEnum, data["thalassemia"]),
             fasting_hours=float(data.get("fasting_hours", 8)),
             smoker=_bool(data.get("smoker", False)),
             diabetic=_bool(data.get("diabetic", False)),
@@ -124,13 +141,13 @@ class HealthPredictionRequest:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthyRange:
     low: float
     high: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ChartDatum:
     label: str
     user_value: float
@@ -138,7 +155,7 @@ class ChartDatum:
     population_avg: float
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthPredictionResponse:
     name: str
     risk_category: str
@@ -151,8 +168,30 @@ class HealthPredictionResponse:
     feature_importance: Dict[str, float]
     recommended_actions: List[str]
 
-
-@dataclass
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "risk_category": self.risk_category,
+            "risk_score": self.risk_score,
+            "probability": self.probability,
+            "classification": self.classification,
+            "advisory_message": self.advisory_message,
+            "chart": [
+                {
+                    "label": datum.label,
+                    "user_value": datum.user_value,
+                    "recommended": {"low": datum.recommended.low, "high": datum.recommended.high},
+                    "population_avg": datum.population_avg,
+                }
+                for datum in self.chart
+            ],
+            "key_insights": list(self.key_insights),
+            "feature_importance": dict(self.feature_importance),
+            "recommended_actions": list(self.recommended_actions),
+        }
+
+
+@dataclass(slots=True)
 class EmergencyRequest:
     reason: str
     vitals: Dict[str, str]
@@ -173,8 +212,15 @@ class EmergencyRequest:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EmergencyResponse:
     sms_dispatched: List[str]
     calls_triggered: List[str]
     dry_run: bool = False
+
+    def to_dict(self) -> Dict:
+        return {
+            "sms_dispatched": list(self.sms_dispatched),
+            "calls_triggered": list(self.calls_triggered),
+            "dry_run": self.dry_run,
+        }
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from typing import Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """Merges concurrent single-item calls into one batched call on a worker thread.
+
+    A call that finds nothing queued or running is processed at once on the calling
+    thread, so a lone request never waits. Calls arriving while a batch is in flight
+    are queued and flushed together (up to ``max_batch_size``) as soon as it finishes.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[T]], Sequence[R]],
+        max_batch_size: int = 32,
+    ) -> None:
+        self._process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self._pending: List[Tuple[T, Future]] = []
+        self._condition = threading.Condition()
+        self._busy = False
+        self._worker: Optional[threading.Thread] = None
+
+    def submit(self, item: T) -> R:
+        with self._condition:
+            inline = not self._busy and not self._pending
+            if inline:
+                self._busy = True
+            else:
+                future: Future = Future()
+                if self._worker is None or not self._worker.is_alive():
+                    # started lazily so forked server workers each get their own thread
+                    self._worker = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+                    self._worker.start()
+                self._pending.append((item, future))
+        if inline:
+            # nothing to merge with: run on this thread (the common case under sync workers)
+            try:
+                return self._call([item])[0]
+            finally:
+                self._release()
+        return future.result()
+
+    def _call(self, items: List[T]) -> Sequence[R]:
+        results = self._process_batch(items)
+        if len(results) != len(items):
+            # zip would leave the surplus callers waiting forever
+            raise RuntimeError(f"process_batch returned {len(results)} results for {len(items)} items")
+        return results
+
+    def _release(self) -> None:
+        with self._condition:
+            self._busy = False
+            self._condition.notify_all()
+
+    def _next_batch(self) -> List[Tuple[T, Future]]:
+        with self._condition:
+            # items queue up only while a batch is in flight; take them once it finishes
+            while self._busy or not self._pending:
+                self._condition.wait()
+            self._busy = True
+            batch = self._pending[: self.max_batch_size]
+            del self._pending[: self.max_batch_size]
+            return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            try:
+                results = self._call([item for item, _ in batch])
+            except Exception as exc:  # surface the failure to every waiting caller
+                for _, future in batch:
+                    future.set_exception(exc)
+            else:
+                for (_, future), result in zip(batch, results):
+                    future.set_result(result)
+            finally:
+                self._release()
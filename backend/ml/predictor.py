@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import json
-import math
-import pathlib
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from backend.api.schemas import ChartDatum, HealthPredictionRequest, HealthPredictionResponse, HealthyRange
 from backend.utils.config import get_settings
@@ -30,19 +30,45 @@ THAL_MAPPING = {
     "reversible_defect": 7,
 }
 
+# Request attributes plotted against the dataset stats, in display order.
+CHART_FIELDS = ("bp_systolic", "cholesterol", "max_heart_rate", "sugar_level")
+
+# Positions used by ``_request_vector``; artifact arrays are reordered to match at load time.
+REQUEST_FEATURES = (
+    "age",
+    "sex",
+    "cp",
+    "trestbps",
+    "chol",
+    "fbs",
+    "restecg",
+    "thalach",
+    "exang",
+    "oldpeak",
+    "slope",
+    "ca",
+    "thal",
+)
+
 
 class HeartAttackPredictor:
     def __init__(self) -> None:
         settings = get_settings()
-        self.model_path = pathlib.Path(settings.model_path)
-        self.stats_path = pathlib.Path(settings.stats_path)
-        self.report_path = pathlib.Path(settings.report_path)
+        self.model_path = settings.model_path_obj
+        self.stats_path = settings.stats_path_obj
+        self.report_path = settings.report_path_obj
         self.feature_order: List[str] = []
         self.weights: List[float] = []
         self.bias: float = 0.0
         self.scaling: Dict[str, Dict[str, float]] = {}
+        self._means = np.zeros(len(REQUEST_FEATURES), dtype=np.float64)
+        self._inv_std = np.ones(len(REQUEST_FEATURES), dtype=np.float64)
+        self._weights_np = np.zeros(len(REQUEST_FEATURES), dtype=np.float64)
+        self._w_eff = np.zeros(len(REQUEST_FEATURES), dtype=np.float64)
+        self._b_eff = 0.0
         self._stats: Dict[str, Dict[str, float]] = {}
         self._feature_importance: Dict[str, float] = {}
+        self._chart_spec: List[Tuple[str, str, HealthyRange, float]] = []
         self.load_artifacts()
 
     def load_artifacts(self) -> None:
@@ -51,16 +77,21 @@ class HeartAttackPredictor:
         if not self.stats_path.exists():
             raise FileNotFoundError(f"Feature stats missing at {self.stats_path}")
 
-        with self.model_path.open("r", encoding="utf-8") as model_file:
-            payload = json.load(model_file)
-            self.feature_order = payload["feature_order"]
-            self.weights = payload["weights"]
-            self.bias = payload["bias"]
-            self.scaling = payload["scaling"]
+        self._load_json_model()
 
         with self.stats_path.open("r", encoding="utf-8") as stats_file:
             stats_payload = json.load(stats_file)
             self._stats = stats_payload.get("feature_stats", stats_payload)
+        self._chart_spec = [
+            (
+                field,
+                field.replace("_", " ").title(),
+                HealthyRange(low=stats["healthy_low"], high=stats["healthy_high"]),
+                stats["mean"],
+            )
+            for field in CHART_FIELDS
+            if (stats := self._stats.get(field))
+        ]
 
         if self.report_path.exists():
             with self.report_path.open("r", encoding="utf-8") as report_file:
@@ -69,35 +100,61 @@ class HeartAttackPredictor:
         else:
             self._feature_importance = {}
 
-    def _request_vector(self, payload: HealthPredictionRequest) -> List[float]:
-        row = {
-            "age": float(payload.age),
-            "sex": 1.0 if payload.sex.value == "male" else 0.0,
-            "cp": float(CHEST_PAIN_MAPPING[payload.chest_pain_type.value]),
-            "trestbps": float(payload.bp_systolic),
-            "chol": float(payload.cholesterol),
-            "fbs": 1.0 if payload.sugar_level >= 126 else 0.0,
-            "restecg": float(REST_ECG_MAPPING[payload.resting_ecg.value]),
-            "thalach": float(payload.max_heart_rate),
-            "exang": 1.0 if payload.exercise_angina else 0.0,
-            "oldpeak": float(payload.st_depression),
-            "slope": float(SLOPE_MAPPING[payload.slope.value]),
-            "ca": float(payload.num_major_vessels),
-            "thal": float(THAL_MAPPING[payload.thalassemia.value]),
-        }
-        vector: List[float] = []
-        for feature in self.feature_order:
-            stats = self.scaling.get(feature)
-            value = row[feature]
-            if stats:
-                value = (value - stats["mean"]) / stats["std"]
-            vector.append(value)
+    def _load_json_model(self) -> None:
+        with self.model_path.open("r", encoding="utf-8") as model_file:
+            payload = json.load(model_file)
+            self.feature_order = payload["feature_order"]
+            self.weights = payload["weights"]
+            self.bias = payload["bias"]
+            self.scaling = payload["scaling"]
+
+        self._set_model_arrays(
+            np.asarray(self.weights, dtype=np.float64),
+            np.array([self.scaling[f]["mean"] if f in self.scaling else 0.0 for f in self.feature_order]),
+            1.0 / np.array([self.scaling[f]["std"] if f in self.scaling else 1.0 for f in self.feature_order]),
+        )
+
+    def _set_model_arrays(self, weights: np.ndarray, means: np.ndarray, inv_std: np.ndarray) -> None:
+        # reorder from the artifact's feature order into REQUEST_FEATURES positions
+        index = {feature: position for position, feature in enumerate(self.feature_order)}
+        self._weights_np = np.array([weights[index[f]] if f in index else 0.0 for f in REQUEST_FEATURES])
+        self._means = np.array([means[index[f]] if f in index else 0.0 for f in REQUEST_FEATURES])
+        self._inv_std = np.array([inv_std[index[f]] if f in index else 1.0 for f in REQUEST_FEATURES])
+        # fold standardization into the weights: w.((x - m) * s) + b == (w * s).x + (b - (w * s).m)
+        self._w_eff = self._weights_np * self._inv_std
+        self._b_eff = self.bias - float(np.dot(self._w_eff, self._means))
+
+    def _request_vector(self, payload: HealthPredictionRequest, out: Optional[np.ndarray] = None) -> np.ndarray:
+        vector = np.empty(len(REQUEST_FEATURES), dtype=np.float64) if out is None else out
+        vector[0] = payload.age
+        vector[1] = 1.0 if payload.sex.value == "male" else 0.0
+        vector[2] = CHEST_PAIN_MAPPING[payload.chest_pain_type.value]
+        vector[3] = payload.bp_systolic
+        vector[4] = payload.cholesterol
+        vector[5] = 1.0 if payload.sugar_level >= 126 else 0.0
+        vector[6] = REST_ECG_MAPPING[payload.resting_ecg.value]
+        vector[7] = payload.max_heart_rate
+        vector[8] = 1.0 if payload.exercise_angina else 0.0
+        vector[9] = payload.st_depression
+        vector[10] = SLOPE_MAPPING[payload.slope.value]
+        vector[11] = payload.num_major_vessels
+        vector[12] = THAL_MAPPING[payload.thalassemia.value]
         return vector
 
-    def _predict_probability(self, vector: List[float]) -> float:
-        score = sum(weight * value for weight, value in zip(self.weights, vector)) + self.bias
-        capped = max(min(score, 60), -60)
-        return 1.0 / (1.0 + math.exp(-capped))
+    def _request_matrix(self, payloads: Sequence[HealthPredictionRequest]) -> np.ndarray:
+        matrix = np.empty((len(payloads), len(REQUEST_FEATURES)), dtype=np.float64)
+        for row, payload in zip(matrix, payloads):
+            self._request_vector(payload, out=row)
+        return matrix
+
+    def predict_proba(self, payloads: Sequence[HealthPredictionRequest]) -> np.ndarray:
+        """Score many requests with a single matrix-vector product."""
+        if not self.weights:
+            raise RuntimeError("Model weights missing")
+
+        matrix = self._request_matrix(payloads)
+        scores = np.clip(matrix @ self._w_eff + self._b_eff, -60, 60)
+        return 1.0 / (1.0 + np.exp(-scores))
 
     @staticmethod
     def _categorize_risk(probability: float) -> str:
@@ -108,26 +165,15 @@ class HeartAttackPredictor:
         return "High"
 
     def _chart_data(self, payload: HealthPredictionRequest) -> List[ChartDatum]:
-        chart_fields = [
-            ("bp_systolic", payload.bp_systolic),
-            ("cholesterol", payload.cholesterol),
-            ("max_heart_rate", payload.max_heart_rate),
-            ("sugar_level", payload.sugar_level),
-        ]
-        chart: List[ChartDatum] = []
-        for field, value in chart_fields:
-            stats = self._stats.get(field)
-            if not stats:
-                continue
-            chart.append(
-                ChartDatum(
-                    label=field.replace("_", " ").title(),
-                    user_value=float(value),
-                    recommended=HealthyRange(low=stats["healthy_low"], high=stats["healthy_high"]),
-                    population_avg=stats["mean"],
-                )
+        return [
+            ChartDatum(
+                label=label,
+                user_value=float(getattr(payload, field)),
+                recommended=recommended,
+                population_avg=population_avg,
             )
-        return chart
+            for field, label, recommended, population_avg in self._chart_spec
+        ]
 
     def _insights(self, payload: HealthPredictionRequest) -> List[str]:
         insights: List[str] = []
@@ -163,12 +209,10 @@ class HeartAttackPredictor:
             recommendations.append("Bring fasting sugar under 110 mg/dL through diet, metformin, or both.")
         return recommendations
 
-    def predict(self, payload: HealthPredictionRequest) -> HealthPredictionResponse:
-        if not self.weights:
-            raise RuntimeError("Model weights missing")
-
-        vector = self._request_vector(payload)
-        probability = self._predict_probability(vector)
+    def build_response(
+        self, payload: HealthPredictionRequest, probability: float, detail: bool = True
+    ) -> HealthPredictionResponse:
+        """Assemble the response; ``detail=False`` skips chart, insights and recommendations."""
         classification = 1 if probability >= 0.5 else 0
         risk_category = self._categorize_risk(probability)
         risk_score = round(probability * 100, 2)
@@ -177,6 +221,20 @@ class HeartAttackPredictor:
             "High myocardial infarction risk detected." if risk_category == "High" else "Risk is manageable with standard precautions."
         )
 
+        if not detail:
+            return HealthPredictionResponse(
+                name=payload.name,
+                risk_category=risk_category,
+                risk_score=risk_score,
+                probability=probability,
+                classification=classification,
+                advisory_message=advisory,
+                chart=[],
+                key_insights=[],
+                feature_importance={},
+                recommended_actions=[],
+            )
+
         chart = self._chart_data(payload)
         insights = self._insights(payload)
         recommendations = self._recommendations(risk_category, payload)
@@ -193,3 +251,17 @@ class HeartAttackPredictor:
             feature_importance=self._feature_importance,
             recommended_actions=recommendations,
         )
+
+    def predict(self, payload: HealthPredictionRequest, detail: bool = True) -> HealthPredictionResponse:
+        # a one-row batch, so single and batch scoring share the same arithmetic
+        probability = float(self.predict_proba([payload])[0])
+        return self.build_response(payload, probability, detail)
+
+    def predict_batch(
+        self, payloads: Sequence[HealthPredictionRequest], detail: bool = True
+    ) -> List[HealthPredictionResponse]:
+        probabilities = self.predict_proba(payloads)
+        return [
+            self.build_response(payload, float(probability), detail)
+            for payload, probability in zip(payloads, probabilities)
+        ]
@@ -1,20 +1,49 @@
 from __future__ import annotations
 
 import logging
-from typing import Dict, Iterable, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from xml.sax.saxutils import escape
 
+from requests.adapters import HTTPAdapter
 from twilio.base.exceptions import TwilioRestException
+from twilio.http.http_client import TwilioHttpClient
 from twilio.rest import Client
 
 from backend.utils.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Twilio calls are network-bound, so fan-out runs on threads; the HTTP pool is sized to match.
+_TWILIO_WORKERS = 16
+_twilio_pool = ThreadPoolExecutor(max_workers=_TWILIO_WORKERS, thread_name_prefix="twilio")
+
+_SMS_TEMPLATE = "{message}\nVitals -> {vitals}\nLocation -> {location}"
+_CALL_TEMPLATE = (
+    "<Response>"
+    "<Say voice='alice'>{message}</Say>"
+    "<Pause length='1'/>"
+    "<Say>Location link {location}</Say>"
+    "</Response>"
+)
+_MAPS_LINK = "https://www.google.com/maps?q={},{}"
+
 
 def _format_location_link(latitude: Optional[float], longitude: Optional[float]) -> str:
     if latitude is None or longitude is None:
         return "Location unavailable"
-    return f"https://www.google.com/maps?q={latitude},{longitude}"
+    return _MAPS_LINK.format(latitude, longitude)
+
+
+def _merge_numbers(numbers: Iterable[Optional[str]], seen: Set[str], merged: List[str]) -> None:
+    # remove falsy + duplicates, keeping first-seen order
+    for number in numbers:
+        if not number:
+            continue
+        normalized = number.strip()
+        if normalized and normalized not in seen:
+            seen.add(normalized)
+            merged.append(normalized)
 
 
 class EmergencyDispatcher:
@@ -23,14 +52,20 @@ class EmergencyDispatcher:
     def __init__(self) -> None:
         self.settings = get_settings()
         self._client = self._create_client()
+        base: List[str] = []
+        _merge_numbers(
+            [*self.settings.emergency_contacts, self.settings.emergency_primary_number],
+            set(),
+            base,
+        )
+        self._base_recipients: Tuple[str, ...] = tuple(base)
 
     def _create_client(self) -> Optional[Client]:
-        if (
-            self.settings.twilio_account_sid
-            and self.settings.twilio_auth_token
-            and self.settings.twilio_from_number
-        ):
-            return Client(self.settings.twilio_account_sid, self.settings.twilio_auth_token)
+        twilio = self.settings.twilio
+        if twilio is not None:
+            http_client = TwilioHttpClient()
+            http_client.session.mount("https://", HTTPAdapter(pool_maxsize=_TWILIO_WORKERS))
+            return Client(twilio.account_sid, twilio.auth_token, http_client=http_client)
         logger.warning("Twilio credentials missing. Emergency features will operate in dry-run mode.")
         return None
 
@@ -39,22 +74,24 @@ class EmergencyDispatcher:
         return self._client is not None
 
     def _resolve_recipients(self, extra_contacts: Optional[Iterable[str]] = None) -> List[str]:
-        recipients = list(self.settings.emergency_contacts)
-        if self.settings.emergency_primary_number:
-            recipients.append(self.settings.emergency_primary_number)
+        recipients = list(self._base_recipients)
         if extra_contacts:
-            recipients.extend(extra_contacts)
-        # remove falsy + duplicates
-        seen: set[str] = set()
-        filtered: List[str] = []
-        for number in recipients:
-            if not number:
-                continue
-            normalized = number.strip()
-            if normalized and normalized not in seen:
-                seen.add(normalized)
-                filtered.append(normalized)
-        return filtered
+            _merge_numbers(extra_contacts, set(recipients), recipients)
+        return recipients
+
+    def _fan_out(self, create: Callable[..., object], recipients: List[str], action: str, **kwargs) -> List[str]:
+        futures = {
+            number: _twilio_pool.submit(create, from_=self.settings.twilio.from_number, to=number, **kwargs)
+            for number in recipients
+        }
+        succeeded: List[str] = []
+        for number, future in futures.items():
+            try:
+                future.result()
+                succeeded.append(number)
+            except TwilioRestException as exc:
+                logger.error("Failed to %s %s: %s", action, number, exc)
+        return succeeded
 
     def _build_sms_body(
         self,
@@ -64,8 +101,11 @@ class EmergencyDispatcher:
         longitude: Optional[float],
     ) -> str:
         vitals_summary = ", ".join(f"{k}: {v}" for k, v in vitals.items() if v is not None)
-        location_link = _format_location_link(latitude, longitude)
-        return f"{message}\nVitals -> {vitals_summary}\nLocation -> {location_link}"
+        return _SMS_TEMPLATE.format(
+            message=message,
+            vitals=vitals_summary,
+            location=_format_location_link(latitude, longitude),
+        )
 
     def send_sms_alert(
         self,
@@ -81,23 +121,12 @@ class EmergencyDispatcher:
             return []
 
         body = self._build_sms_body(reason, vitals, latitude, longitude)
-        delivered: List[str] = []
 
         if not self.is_configured:
             logger.info("[DRY-RUN] SMS would be sent to %s: %s", recipients, body)
             return recipients
 
-        for number in recipients:
-            try:
-                self._client.messages.create(
-                    body=body,
-                    from_=self.settings.twilio_from_number,
-                    to=number,
-                )
-                delivered.append(number)
-            except TwilioRestException as exc:
-                logger.error("Failed to send SMS to %s: %s", number, exc)
-        return delivered
+        return self._fan_out(self._client.messages.create, recipients, "send SMS to", body=body)
 
     def place_phone_call(
         self,
@@ -111,27 +140,13 @@ class EmergencyDispatcher:
             logger.warning("No emergency contacts configured; skipping voice call")
             return []
 
-        call_script = (
-            f"<Response>"
-            f"<Say voice='alice'>{voice_message}</Say>"
-            f"<Pause length='1'/>"
-            f"<Say>Location link { _format_location_link(latitude, longitude) }</Say>"
-            f"</Response>"
-        )
-
         if not self.is_configured:
             logger.info("[DRY-RUN] Voice call would be placed to %s", recipients)
             return recipients
 
-        placed: List[str] = []
-        for number in recipients:
-            try:
-                self._client.calls.create(
-                    twiml=call_script,
-                    from_=self.settings.twilio_from_number,
-                    to=number,
-                )
-                placed.append(number)
-            except TwilioRestException as exc:
-                logger.error("Failed to place call to %s: %s", number, exc)
-        return placed
+        # built once and shared by every recipient; user text is escaped so the TwiML stays well-formed
+        call_script = _CALL_TEMPLATE.format(
+            message=escape(voice_message),
+            location=escape(_format_location_link(latitude, longitude)),
+        )
+        return self._fan_out(self._client.calls.create, recipients, "place call to", twiml=call_script)
@@ -1,47 +1,210 @@
 import os
-from dataclasses import dataclass, field
-from functools import lru_cache
-from typing import List, Optional
-
 import pathlib
-
-
-from dotenv import load_dotenv
+import re
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Dict, Optional, Tuple
 
 # --- PATH RESOLUTION ---
 # This finds the absolute path to your project root where the .env file lives
-ROOT_DIR = pathlib.Path(__file__).parent.parent.parent
-ENV_PATH = ROOT_DIR / ".env"
+# (plain strings: no Path objects are built on every worker import)
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+ENV_PATH = os.path.join(ROOT_DIR, ".env")
+# bound once: os.getenv is a Python-level wrapper around this same lookup
+_env_get = os.environ.get
 
-# Load the .env file explicitly from the root directory
-load_dotenv(dotenv_path=ENV_PATH)
+# (Settings field, environment variable, default); unset credentials read as "", never None
+_ENV_FIELDS: Tuple[Tuple[str, str, str], ...] = (
+    ("app_name", "APP_NAME", "CardioSentinel API"),
+    ("dataset_path", "DATASET_PATH", "data/heart_uci.csv"),
+    ("model_path", "MODEL_PATH", "backend/ml/models/heart_attack_model.json"),
+    ("stats_path", "STATS_PATH", "backend/ml/models/feature_stats.json"),
+    ("report_path", "REPORT_PATH", "backend/ml/reports/training_report.json"),
+    ("allowed_origins", "ALLOWED_ORIGINS", "*"),
+    ("twilio_account_sid", "TWILIO_ACCOUNT_SID", ""),
+    ("twilio_auth_token", "TWILIO_AUTH_TOKEN", ""),
+    ("twilio_from_number", "TWILIO_FROM_NUMBER", ""),
+    ("emergency_primary_number", "EMERGENCY_PRIMARY_NUMBER", ""),
+    ("emergency_contacts", "EMERGENCY_CONTACTS", ""),
+)
+# comma-separated variables parsed into tuples
+_LIST_FIELDS = ("allowed_origins", "emergency_contacts")
 
 
-def _read_list(name: str, fallback: str | None = None) -> List[str]:
-    raw = os.getenv(name, fallback or "")
+@cache
+def _read_list(raw: str) -> Tuple[str, ...]:
+    # keyed on the raw value, so a changed variable is re-parsed; tuples are safe to share
     if not raw:
-        return []
-    return [item.strip() for item in raw.split(",") if item.strip()]
+        return ()
+    return tuple(item for item in map(str.strip, raw.split(",")) if item)
+
+
+# shared defaults, so Settings built directly (e.g. in tests) reuses the same tuples as get_settings()
+_DEFAULT_ALLOWED_ORIGINS = _read_list("*")
+_NO_CONTACTS = _read_list("")
+
+class _Unset:
+    """Marks the lazy ``Settings.twilio`` slot as not yet built."""
 
+    __slots__ = ()
 
-@dataclass
+    def __reduce__(self) -> str:
+        # copied and pickled by reference, so the identity check survives copy/pickle
+        return "_UNSET"
+
+
+_UNSET = _Unset()
+
+
+@dataclass(frozen=True, slots=True)
+class TwilioConfig:
+    account_sid: str
+    auth_token: str = field(repr=False)
+    from_number: str
+
+
+@dataclass(init=False, slots=True, frozen=True)
 class Settings:
-    app_name: str = field(default_factory=lambda: os.getenv("APP_NAME", "CardioSentinel API"))
-    dataset_path: str = field(default_factory=lambda: os.getenv("DATASET_PATH", "data/heart_uci.csv"))
-    model_path: str = field(default_factory=lambda: os.getenv("MODEL_PATH", "backend/ml/models/heart_attack_model.json"))
-    stats_path: str = field(default_factory=lambda: os.getenv("STATS_PATH", "backend/ml/models/feature_stats.json"))
-    report_path: str = field(default_factory=lambda: os.getenv("REPORT_PATH", "backend/ml/reports/training_report.json"))
+    """Application configuration read from the environment.
+
+    Built by ``get_settings`` from ``_load_all`` (one pass over ``_ENV_FIELDS``). List-valued
+    settings are tuples shared through ``_read_list``'s cache; they are parsed at that
+    point rather than at import, so values from ``.env`` are seen.
+    """
+
+    app_name: str
+    dataset_path: str
+    model_path: str
+    stats_path: str
+    report_path: str
+
+    allowed_origins: Tuple[str, ...]
+
+    twilio_account_sid: str
+    # kept out of repr, as TwilioConfig.auth_token is, so logs never carry credentials
+    twilio_auth_token: str = field(repr=False)
+    twilio_from_number: str
+
+    emergency_primary_number: str
+    emergency_contacts: Tuple[str, ...]
+
+    # resolved once here so consumers never rebuild Path objects from the strings
+    dataset_path_obj: pathlib.Path = field(init=False, repr=False)
+    model_path_obj: pathlib.Path = field(init=False, repr=False)
+    stats_path_obj: pathlib.Path = field(init=False, repr=False)
+    report_path_obj: pathlib.Path = field(init=False, repr=False)
+    _twilio: object = field(init=False, repr=False, compare=False)
+
+    def __init__(
+        self,
+        *,
+        app_name: str,
+        dataset_path: str,
+        model_path: str,
+        stats_path: str,
+        report_path: str,
+        allowed_origins: Tuple[str, ...] = _DEFAULT_ALLOWED_ORIGINS,
+        twilio_account_sid: str,
+        twilio_auth_token: str,
+        twilio_from_number: str,
+        emergency_primary_number: str,
+        emergency_contacts: Tuple[str, ...] = _NO_CONTACTS,
+    ) -> None:
+        # direct slot stores through one bound setter, no per-field descriptor dispatch
+        assign = object.__setattr__
+        assign(self, "app_name", app_name)
+        assign(self, "dataset_path", dataset_path)
+        assign(self, "model_path", model_path)
+        assign(self, "stats_path", stats_path)
+        assign(self, "report_path", report_path)
+        assign(self, "allowed_origins", allowed_origins)
+        assign(self, "twilio_account_sid", twilio_account_sid)
+        assign(self, "twilio_auth_token", twilio_auth_token)
+        assign(self, "twilio_from_number", twilio_from_number)
+        assign(self, "emergency_primary_number", emergency_primary_number)
+        assign(self, "emergency_contacts", emergency_contacts)
+        assign(self, "dataset_path_obj", pathlib.Path(dataset_path).resolve())
+        assign(self, "model_path_obj", pathlib.Path(model_path).resolve())
+        assign(self, "stats_path_obj", pathlib.Path(stats_path).resolve())
+        assign(self, "report_path_obj", pathlib.Path(report_path).resolve())
+        assign(self, "_twilio", _UNSET)
+
+    @property
+    def twilio(self) -> Optional[TwilioConfig]:
+        """Twilio credentials, or None unless all three are set; built on first access."""
+        config = self._twilio
+        if config is _UNSET:
+            if self.twilio_account_sid and self.twilio_auth_token and self.twilio_from_number:
+                config = TwilioConfig(self.twilio_account_sid, self.twilio_auth_token, self.twilio_from_number)
+            else:
+                config = None
+            object.__setattr__(self, "_twilio", config)
+        return config
+
+
+# quoted values: the closing quote skips backslash-escaped quotes, then only a comment may follow
+_QUOTED_VALUE = {
+    '"': re.compile(r'"((?:\\.|[^"\\])*)"\s*(?:#.*)?$'),
+    "'": re.compile(r"'((?:\\.|[^'\\])*)'\s*(?:#.*)?$"),
+}
+# the escapes python-dotenv expands: all of these in double quotes, only \\ and \' in single quotes
+_ESCAPES = {"\\": "\\", "'": "'", '"': '"', "a": "\a", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v"}
+_DOUBLE_ESCAPE = re.compile(r"\\([\\'\"abfnrtv])")
+_SINGLE_ESCAPE = re.compile(r"\\([\\'])")
+# unquoted values end at whitespace (space or tab) followed by #
+_INLINE_COMMENT = re.compile(r"\s+#")
+
+
+def _parse_env(path: str) -> Dict[str, str]:
+    """Minimal KEY=VALUE parser covering what .env files here use (comments, quotes, export).
+
+    Quoted values may be followed by a ``# comment``; escapes are expanded as python-dotenv
+    does. Multi-line values and ``${VAR}`` interpolation are not supported.
+    """
+    with open(path, "rb") as env_file:
+        lines = env_file.read().decode("utf-8").splitlines()
+
+    parsed: Dict[str, str] = {}
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("export "):
+            line = line[len("export "):].lstrip()
+        key, sep, value = line.partition("=")
+        key = key.strip()
+        if not sep or not key:
+            continue
+        value = value.strip()
+        quoted = _QUOTED_VALUE[value[0]].match(value) if value and value[0] in _QUOTED_VALUE else None
+        if quoted:
+            escape = _DOUBLE_ESCAPE if value[0] == '"' else _SINGLE_ESCAPE
+            value = escape.sub(lambda match: _ESCAPES[match.group(1)], quoted.group(1))
+        else:
+            value = _INLINE_COMMENT.split(value, 1)[0].rstrip()
+        parsed[key] = value
+    return parsed
+
 
-    allowed_origins: List[str] = field(default_factory=lambda: _read_list("ALLOWED_ORIGINS", "*"))
+def _load_env_file() -> None:
+    # Load the .env file explicitly from the root directory. Deployments that inject the
+    # environment themselves (Docker/K8s/systemd) can set SKIP_DOTENV to bypass it.
+    if not os.path.isfile(ENV_PATH) or _env_get("SKIP_DOTENV"):
+        return
+    # variables already present in the environment win, as with python-dotenv's default
+    for key, value in _parse_env(ENV_PATH).items():
+        os.environ.setdefault(key, value)
 
-    twilio_account_sid: Optional[str] = field(default_factory=lambda: os.getenv("TWILIO_ACCOUNT_SID"))
-    twilio_auth_token: Optional[str] = field(default_factory=lambda: os.getenv("TWILIO_AUTH_TOKEN"))
-    twilio_from_number: Optional[str] = field(default_factory=lambda: os.getenv("TWILIO_FROM_NUMBER"))
 
-    emergency_primary_number: Optional[str] = field(default_factory=lambda: os.getenv("EMERGENCY_PRIMARY_NUMBER"))
-    emergency_contacts: List[str] = field(default_factory=lambda: _read_list("EMERGENCY_CONTACTS"))
+def _load_all() -> Dict[str, object]:
+    # one dict comprehension over os.environ for every setting
+    values: Dict[str, object] = {name: _env_get(key, default) for name, key, default in _ENV_FIELDS}
+    for name in _LIST_FIELDS:
+        values[name] = _read_list(values[name])
+    return values
 
 
-@lru_cache
+@cache
 def get_settings() -> Settings:
-    return Settings()
+    _load_env_file()
+    return Settings(**_load_all())
@@ -0,0 +1,123 @@
+import threading
+import time
+
+import pytest
+
+from backend.ml.batching import MicroBatcher
+
+
+def test_lone_call_runs_on_the_calling_thread():
+    threads = []
+
+    def process(items):
+        threads.append(threading.current_thread())
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(process)
+    assert batcher.submit(21) == 42
+    assert threads == [threading.current_thread()]
+
+
+def test_calls_arriving_during_a_batch_are_merged():
+    release = threading.Event()
+    started = threading.Event()
+    batches = []
+
+    def process(items):
+        batches.append(list(items))
+        if len(batches) == 1:
+            started.set()
+            release.wait(5)
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(process, max_batch_size=8)
+    results = {}
+
+    def submit(item):
+        results[item] = batcher.submit(item)
+
+    first = threading.Thread(target=submit, args=(0,), daemon=True)
+    first.start()
+    assert started.wait(5)
+    queued = [threading.Thread(target=submit, args=(item,), daemon=True) for item in range(1, 6)]
+    for thread in queued:
+        thread.start()
+    # wait until every queued call is pending before letting the first batch finish
+    while len(batcher._pending) < len(queued):
+        time.sleep(0.001)
+    release.set()
+    for thread in [first, *queued]:
+        thread.join(5)
+
+    assert results == {item: item * 2 for item in range(6)}
+    assert batches[0] == [0]
+    assert sorted(batches[1]) == [1, 2, 3, 4, 5]
+
+
+def test_batches_respect_max_batch_size():
+    sizes = []
+    gate = threading.Lock()
+
+    def process(items):
+        with gate:
+            sizes.append(len(items))
+        return list(items)
+
+    batcher = MicroBatcher(process, max_batch_size=4)
+    threads = [threading.Thread(target=batcher.submit, args=(item,), daemon=True) for item in range(40)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert sum(sizes) == 40
+    assert max(sizes) <= 4
+
+
+def test_errors_reach_every_caller_and_the_batcher_recovers():
+    fail = True
+
+    def process(items):
+        if fail:
+            raise ValueError("boom")
+        return list(items)
+
+    batcher = MicroBatcher(process)
+    with pytest.raises(ValueError, match="boom"):
+        batcher.submit(1)
+    fail = False
+    assert batcher.submit(2) == 2
+
+
+def test_short_result_lists_fail_instead_of_hanging():
+    release = threading.Event()
+    started = threading.Event()
+
+    def process(items):
+        if not started.is_set():
+            started.set()
+            release.wait(5)
+        return list(items)[:-1]
+
+    batcher = MicroBatcher(process)
+    errors = []
+
+    def submit(item):
+        try:
+            batcher.submit(item)
+        except RuntimeError as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=submit, args=(item,), daemon=True) for item in range(3)]
+    threads[0].start()
+    assert started.wait(5)
+    for thread in threads[1:]:
+        thread.start()
+    while len(batcher._pending) < 2:
+        time.sleep(0.001)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert not any(thread.is_alive() for thread in threads)
+    assert len(errors) == 3
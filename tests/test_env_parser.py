@@ -0,0 +1,39 @@
+from backend.utils.config import _parse_env
+
+
+def parse(tmp_path, text):
+    env_file = tmp_path / ".env"
+    env_file.write_text(text, encoding="utf-8")
+    return _parse_env(str(env_file))
+
+
+def test_plain_values_comments_and_export(tmp_path):
+    parsed = parse(
+        tmp_path,
+        "# comment\n"
+        "\n"
+        "APP_NAME=CardioSentinel\n"
+        "export MODEL_PATH = models/model.json\n"
+        "NO_EQUALS_SIGN\n"
+        "EMPTY=\n",
+    )
+    assert parsed == {"APP_NAME": "CardioSentinel", "MODEL_PATH": "models/model.json", "EMPTY": ""}
+
+
+def test_inline_comments_after_unquoted_values(tmp_path):
+    parsed = parse(tmp_path, "A=value # note\nB=value\t# note\nC=a#b\n")
+    assert parsed == {"A": "value", "B": "value", "C": "a#b"}
+
+
+def test_quoted_values_followed_by_comments(tmp_path):
+    parsed = parse(tmp_path, 'TOKEN="abc" # prod\nSINGLE=\'x y\'  # c\nHASH="a # not a comment"\n')
+    assert parsed == {"TOKEN": "abc", "SINGLE": "x y", "HASH": "a # not a comment"}
+
+
+def test_escapes(tmp_path):
+    parsed = parse(tmp_path, 'D="line1\\nline2\\t\\"q\\" \\\\"\nS=\'it\\\'s \\\\ \\n\'\n')
+    assert parsed == {"D": 'line1\nline2\t"q" \\', "S": "it's \\ \\n"}
+
+
+def test_interpolation_is_not_expanded(tmp_path):
+    assert parse(tmp_path, "A=1\nP=${A}\n") == {"A": "1", "P": "${A}"}